@@ -1,16 +1,50 @@
+import os
+import time
 from datetime import datetime
 from typing import Any, Dict
 
-from litestar import Litestar, get
+from litestar import Litestar, MediaType, Response, get
+from litestar.config.compression import CompressionConfig
 from litestar.config.cors import CORSConfig
-from litestar.openapi import OpenAPIConfig
+from litestar.openapi import OpenAPIConfig, ResponseSpec
+from litestar.serialization import encode_json
 
 
-# Временные эндпоинты для демонстрации архитектуры
-@get("/")
-async def root() -> Dict[str, Any]:
-    """Корневой эндпоинт - информация о API."""
-    return {
+# Продакшен-режим включается переменной окружения APP_ENV=production
+IS_PRODUCTION = os.getenv("APP_ENV", "development") == "production"
+
+# Эндпоинты отдают готовые байты, поэтому форму ответа для OpenAPI задаём явно
+_JSON_OBJECT_RESPONSES = {
+    200: ResponseSpec(
+        data_container=Dict[str, Any],
+        description="Request fulfilled, document follows",
+        generate_examples=False,
+        media_type=MediaType.JSON,
+    )
+}
+
+# Кэш тела ответа health_check: пересобирается не чаще раза в секунду
+_health_cache: Dict[str, Any] = {"second": -1, "body": b""}
+
+
+def _health_body() -> bytes:
+    """Сериализованный ответ health_check с точностью до секунды."""
+    second = int(time.time())
+    if second != _health_cache["second"]:
+        _health_cache["body"] = encode_json(
+            {
+                "status": "healthy",
+                "timestamp": datetime.fromtimestamp(second).isoformat(),
+                "service": "sneaker-library",
+            }
+        )
+        _health_cache["second"] = second
+    return _health_cache["body"]
+
+
+# Ответ корневого эндпоинта неизменен, поэтому сериализуется один раз при импорте
+_ROOT_BODY = encode_json(
+    {
         "name": "Sneaker Library API",
         "version": "1.0.0",
         "description": "DDD-архитектура для управления коллекцией кроссовок",
@@ -27,16 +61,20 @@ async def root() -> Dict[str, Any]:
             "Личные коллекции пользователей",
         ],
     }
+)
+
+
+# Временные эндпоинты для демонстрации архитектуры
+@get("/", responses=_JSON_OBJECT_RESPONSES)
+async def root() -> Response[bytes]:
+    """Корневой эндпоинт - информация о API."""
+    return Response(_ROOT_BODY, media_type=MediaType.JSON)
 
 
-@get("/health")
-async def health_check() -> Dict[str, Any]:
+@get("/health", responses=_JSON_OBJECT_RESPONSES)
+async def health_check() -> Response[bytes]:
     """Проверка состояния сервиса."""
-    return {
-        "status": "healthy",
-        "timestamp": datetime.now().isoformat(),
-        "service": "sneaker-library",
-    }
+    return Response(_health_body(), media_type=MediaType.JSON)
 
 
 def create_app() -> Litestar:
@@ -48,6 +86,15 @@ def create_app() -> Litestar:
         allow_methods=["GET", "POST", "PUT", "DELETE", "PATCH"],
         allow_headers=["*"],
         allow_credentials=True,
+        max_age=86400,  # Браузеры кэшируют preflight-ответ на сутки
+    )
+
+    # Конфигурация сжатия: мелкие ответы и health-пробы не сжимаются
+    compression_config = CompressionConfig(
+        backend="gzip",
+        minimum_size=1024,
+        gzip_compress_level=5,
+        exclude=["^/health$"],
     )
 
     # Конфигурация OpenAPI
@@ -68,8 +115,9 @@ def create_app() -> Litestar:
     app = Litestar(
         route_handlers=[root, health_check],
         cors_config=cors_config,
+        compression_config=compression_config,
         openapi_config=openapi_config,
-        debug=True,  # TODO: Убрать в продакшене
+        debug=not IS_PRODUCTION,
     )
 
     return app
@@ -81,10 +129,18 @@ app = create_app()
 if __name__ == "__main__":
     import uvicorn
 
+    # В продакшене по воркеру на ядро; reload несовместим с несколькими воркерами
+    workers = int(os.getenv("APP_WORKERS", os.cpu_count() or 1)) if IS_PRODUCTION else 1
+
     uvicorn.run(
-        "main:app",
+        "app:app",
         host="0.0.0.0",
         port=8000,
-        reload=True,  # TODO: Убрать в продакшене
-        log_level="info",
+        reload=not IS_PRODUCTION,
+        workers=workers,
+        log_level="warning" if IS_PRODUCTION else "info",
+        access_log=not IS_PRODUCTION,
+        proxy_headers=not IS_PRODUCTION,
+        loop="uvloop",
+        http="httptools",
     )